@@ -11,27 +11,19 @@ Usage:
 """
 
 import os
+import sys
 import time
 from pathlib import Path
 
+# Add shared modules to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
 # Detect simulation mode early
 USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
 
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
-
-# Optional: for camera/vision programs
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
-
-try:
-    import cv2
-    HAS_CV2 = True
-except ImportError:
-    HAS_CV2 = False
+# Heavy dependencies (robot SDK, numpy, cv2) are imported on first use,
+# so programs that never touch the camera start fast
+from shared.robot import get_robot, move
 
 
 # =============================================================================
@@ -42,25 +34,6 @@ PROGRAM_DIR = Path(__file__).parent
 TEST_IMAGES_DIR = PROGRAM_DIR / "test_images"
 
 
-# =============================================================================
-# ROBOT CONNECTION
-# =============================================================================
-
-def get_robot():
-    """
-    Connect to robot or simulator.
-
-    In simulation: disables camera to avoid errors
-    On real robot: full media access
-    """
-    if USE_SIM:
-        print("[SIM] Connecting to simulator...")
-        return ReachyMini(media_backend="no_media")
-    else:
-        print("[ROBOT] Connecting to real robot...")
-        return ReachyMini()
-
-
 # =============================================================================
 # CAMERA HELPERS
 # =============================================================================
@@ -80,7 +53,9 @@ def get_camera_frame(robot):
 
 def _get_test_image():
     """Load a test image for simulation mode."""
-    if not HAS_CV2:
+    try:
+        import cv2
+    except ImportError:
         print("[SIM] OpenCV not available, skipping camera")
         return None
 
@@ -94,11 +69,10 @@ def _get_test_image():
             return img
 
     # Create a dummy colored image if no test images
-    if HAS_NUMPY:
-        print("[SIM] No test images found, using dummy frame")
-        return np.zeros((480, 640, 3), dtype=np.uint8)
-
-    return None
+    # (cv2 depends on numpy, so it is available here)
+    import numpy as np
+    print("[SIM] No test images found, using dummy frame")
+    return np.zeros((480, 640, 3), dtype=np.uint8)
 
 
 # =============================================================================
@@ -156,11 +130,7 @@ def move_head(robot, z=0, roll=0, pitch=0, duration=0.5):
         pitch: Tilt forward/back in degrees (positive = forward)
         duration: Time to reach position in seconds
     """
-    robot.goto_target(
-        head=create_head_pose(z=z, roll=roll, degrees=True, mm=True),
-        duration=duration
-    )
-    time.sleep(duration + 0.1)  # Wait for movement to complete
+    move(robot, z=z, roll=roll, duration=duration, settle=0.1)
 
 
 def look_around(robot):
@@ -2,13 +2,17 @@
 Dance Party
 ===========
 Reachy-Mini dances and sings in an infinite loop!
-Each cycle is ~5 seconds.
+Each cycle is ~5 seconds. The cycle budget is calibrated from the first few
+cycles; when cycles run over (TTS stalls, daemon lag) the loop catches up by
+picking shorter routines and skipping lyrics until it is back on schedule.
 
 Press Ctrl+C to stop.
 
 Uses Hugging Face MMS-TTS for realistic text-to-speech.
+Run with --beat to play a beat under the lyrics through the shared mixer.
 """
 
+import argparse
 import os
 import sys
 import time
@@ -19,32 +23,39 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
 
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
+from shared.loop import CycleWatchdog
+from shared.robot import get_robot, move
 from shared.tts import say_async
 
+# Budget = mean of the first CALIBRATION_CYCLES cycles + BUDGET_MARGIN,
+# so it reflects real move round-trips, not just the routines' sleeps
+CALIBRATION_CYCLES = 4
+BUDGET_MARGIN = 0.15
+MAX_SKIPPED_LYRICS = 2  # sing anyway after this many skips in a row
+BEAT_BPM = 120
 
-def get_robot():
-    if USE_SIM:
-        print("[SIM] Connecting to simulator...")
-        return ReachyMini(media_backend="no_media")
-    else:
-        print("[ROBOT] Connecting to real robot...")
-        return ReachyMini()
+# Set in main() when --beat is used; lyrics are then mixed over the beat
+mixer = None
 
-
-def move(robot, z=0, roll=0, duration=0.2):
-    """Quick move helper."""
-    robot.goto_target(
-        head=create_head_pose(z=z, roll=roll, degrees=True, mm=True),
-        duration=duration
-    )
-    time.sleep(duration)
+watchdog = CycleWatchdog(budget=None, calibrate=CALIBRATION_CYCLES,
+                         margin=BUDGET_MARGIN, name="DANCE")
+skipped_lyrics = 0
 
 
 def say(robot, text):
     """Say something using Hugging Face TTS (non-blocking)."""
-    say_async(text, robot)
+    say_async(text, robot, mixer=mixer)
+
+
+def sing(robot, text):
+    """Sing a lyric, unless the loop is behind schedule (a few times in a row at most)."""
+    global skipped_lyrics
+    if watchdog.behind and skipped_lyrics < MAX_SKIPPED_LYRICS:
+        skipped_lyrics += 1
+        print(f"[DANCE] Behind schedule, skipping lyric: {text}")
+        return
+    skipped_lyrics = 0
+    say(robot, text)
 
 
 # =============================================================================
@@ -129,7 +140,7 @@ LYRICS = [
 
 def dance_routine_1(robot):
     """Routine 1: Classic dance."""
-    say(robot, random.choice(LYRICS))
+    sing(robot, random.choice(LYRICS))
     head_bob(robot)
     side_to_side(robot)
     wiggle(robot)
@@ -138,7 +149,7 @@ def dance_routine_1(robot):
 
 def dance_routine_2(robot):
     """Routine 2: Dramatic dance."""
-    say(robot, random.choice(LYRICS))
+    sing(robot, random.choice(LYRICS))
     look_up_down(robot)
     circle_head(robot)
     head_bob(robot)
@@ -147,7 +158,7 @@ def dance_routine_2(robot):
 
 def dance_routine_3(robot):
     """Routine 3: Energetic dance."""
-    say(robot, random.choice(LYRICS))
+    sing(robot, random.choice(LYRICS))
     excited_shake(robot)
     side_to_side(robot)
     wiggle(robot)
@@ -156,7 +167,7 @@ def dance_routine_3(robot):
 
 def dance_routine_4(robot):
     """Routine 4: Smooth dance."""
-    say(robot, random.choice(LYRICS))
+    sing(robot, random.choice(LYRICS))
     circle_head(robot)
     side_to_side(robot)
     look_up_down(robot)
@@ -175,7 +186,28 @@ ROUTINES = [
 # MAIN
 # =============================================================================
 
+def start_beat(robot):
+    """Start the shared mixer with a looping beat (None if no audio output)."""
+    try:
+        from shared.mixer import LocalSink, Mixer, RobotSink, click_track
+
+        beat_mixer = Mixer()
+        beat_mixer.add(click_track(bpm=BEAT_BPM, beats=8, sample_rate=beat_mixer.sample_rate),
+                       gain=0.5, kind="music", loop=True)
+        beat_mixer.start(LocalSink() if USE_SIM else RobotSink(robot))
+    except Exception as e:
+        print(f"[DANCE] Can't start the beat ({e}), dancing without it")
+        return None
+    return beat_mixer
+
+
 def main():
+    global mixer
+
+    parser = argparse.ArgumentParser(description="Reachy-Mini dance party")
+    parser.add_argument("--beat", action="store_true", help="play a beat under the lyrics")
+    args = parser.parse_args()
+
     mode = "SIMULATOR" if USE_SIM else "REAL ROBOT"
     print("=" * 50)
     print(f"   DANCE PARTY [{mode}]")
@@ -183,6 +215,9 @@ def main():
     print("Press Ctrl+C to stop\n")
 
     with get_robot() as robot:
+        if args.beat:
+            mixer = start_beat(robot)
+
         print("Let's dance!\n")
         say(robot, "Let's dance!")
         time.sleep(0.5)
@@ -193,14 +228,19 @@ def main():
                 cycle += 1
                 print(f"--- Cycle {cycle} ---")
 
-                # Pick a random routine
-                routine = random.choice(ROUTINES)
-                routine(robot)
+                # Pick a random routine (a shorter one if behind schedule)
+                routine = watchdog.pick(ROUTINES)
+                with watchdog.cycle(routine.__name__):
+                    routine(robot)
 
         except KeyboardInterrupt:
             print("\n\nDance party over!")
+            watchdog.report()
             say(robot, "That was fun!")
             move(robot, z=0, roll=0, duration=0.3)
+            if mixer is not None:
+                time.sleep(2.0)  # let the last line play over the beat
+                mixer.stop()
             print("Goodbye!")
 
 
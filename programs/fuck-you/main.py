@@ -5,34 +5,25 @@ Luzia declares war on the bots, then recites Tantum Ergo in Latin.
 With dance moves.
 
 Press Ctrl+C to stop.
+
+The show is deterministic, so it can be rendered ahead of time:
+    python main.py --compile show.npz   # synthesize speech + record moves
+    python main.py --play show.npz      # replay with no TTS at runtime
 """
 
+import argparse
 import os
 import sys
-import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
-
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
-from shared.tts import say_async
-
-
-def get_robot():
-    if USE_SIM:
-        return ReachyMini(media_backend="no_media")
-    else:
-        return ReachyMini()
+from shared.bundle import Bundle, BundleRecorder, play_bundle, speak
+from shared.loop import CycleWatchdog
+from shared.robot import get_robot, move, pause
+from shared.tts import models
 
-
-def move(robot, z=0, roll=0, duration=0.2):
-    robot.goto_target(
-        head=create_head_pose(z=z, roll=roll, degrees=True, mm=True),
-        duration=duration
-    )
-    time.sleep(duration)
+CYCLE_BUDGET = 30.0  # seconds for declaration + full hymn
+PLAYBACK_SLACK = 0.25  # seconds of per-cycle overhead allowed in --play
 
 
 # Dance moves
@@ -59,7 +50,7 @@ def aggressive_shake(robot):
 
 def reverent_bow(robot):
     move(robot, z=-10, duration=0.5)
-    time.sleep(0.3)
+    pause(robot, 0.3)
     move(robot, z=0, duration=0.5)
 
 
@@ -72,7 +63,7 @@ def gentle_sway(robot):
 # The declaration
 DECLARATION = "I'm Luzia and I'll fuck Dola, CiCi and all those mother fucking bots out there. I MEAN IT!"
 
-# Tantum Ergo in Latin (traditional hymn)
+# Tantum Ergo in Latin (traditional hymn), spoken with the Latin MMS voice
 TANTUM_ERGO = [
     "Tantum ergo Sacramentum",
     "Veneremur cernui",
@@ -90,35 +81,88 @@ TANTUM_ERGO = [
 ]
 
 
+def run_cycle(robot, watchdog):
+    """Declaration followed by the full hymn."""
+    # Part 1: Aggressive declaration with dancing
+    print("\n=== DECLARATION ===")
+    speak(robot, DECLARATION)
+    aggressive_shake(robot)
+    head_bob(robot)
+    side_to_side(robot)
+    aggressive_shake(robot)
+    pause(robot, 1)
+
+    # Part 2: Reverent Tantum Ergo with gentle movements
+    print("\n=== TANTUM ERGO ===")
+    for line in TANTUM_ERGO:
+        speak(robot, line, language="lat")
+        if "Amen" in line:
+            reverent_bow(robot)
+        else:
+            gentle_sway(robot)
+        pause(robot, 0.5)
+
+    # Rest between cycles, unless we need to catch up
+    if not watchdog.behind:
+        pause(robot, 2)
+
+
+def compile_show(path):
+    """Render one cycle to a bundle, without touching the robot."""
+    with BundleRecorder() as recorder:
+        run_cycle(recorder, CycleWatchdog(budget=CYCLE_BUDGET))
+        recorder.compile(path)
+
+
+def play_show(path):
+    """Replay a compiled bundle in a loop."""
+    bundle = Bundle.load(path)
+    # play_bundle() sleeps until exactly bundle.length; the slack covers
+    # writing the WAV and starting audio, which the watchdog also times
+    watchdog = CycleWatchdog(budget=bundle.length + PLAYBACK_SLACK, window=10, name="FUCK-YOU")
+
+    with get_robot() as robot:
+        try:
+            while True:
+                with watchdog.cycle():
+                    play_bundle(robot, bundle)
+
+        except KeyboardInterrupt:
+            print("\nStopped.")
+            watchdog.report()
+            models.report()
+        finally:
+            bundle.close()
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Luzia's declaration and Tantum Ergo")
+    parser.add_argument("--compile", metavar="BUNDLE", help="render the show to a bundle and exit")
+    parser.add_argument("--play", metavar="BUNDLE", help="replay a compiled bundle")
+    args = parser.parse_args()
+
+    if args.compile:
+        compile_show(args.compile)
+        return
+    if args.play:
+        print("Press Ctrl+C to stop\n")
+        play_show(args.play)
+        return
+
     print("Press Ctrl+C to stop\n")
 
+    watchdog = CycleWatchdog(budget=CYCLE_BUDGET, window=10, name="FUCK-YOU")
+
     with get_robot() as robot:
         try:
             while True:
-                # Part 1: Aggressive declaration with dancing
-                print("\n=== DECLARATION ===")
-                say_async(DECLARATION, robot)
-                aggressive_shake(robot)
-                head_bob(robot)
-                side_to_side(robot)
-                aggressive_shake(robot)
-                time.sleep(1)
-
-                # Part 2: Reverent Tantum Ergo with gentle movements
-                print("\n=== TANTUM ERGO ===")
-                for line in TANTUM_ERGO:
-                    say_async(line, robot)
-                    if "Amen" in line:
-                        reverent_bow(robot)
-                    else:
-                        gentle_sway(robot)
-                    time.sleep(0.5)
-
-                time.sleep(2)
+                with watchdog.cycle():
+                    run_cycle(robot, watchdog)
 
         except KeyboardInterrupt:
             print("\nStopped.")
+            watchdog.report()
+            models.report()
 
 
 if __name__ == "__main__":
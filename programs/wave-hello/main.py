@@ -6,29 +6,19 @@ Works in both simulation and on the real robot.
 """
 
 import os
+import sys
 import time
-from reachy_mini import ReachyMini
-from reachy_mini.utils import create_head_pose
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-def get_robot():
-    """Connect to robot or simulator based on environment."""
-    use_sim = os.environ.get("REACHY_MINI_SIM", "0") == "1"
-
-    if use_sim:
-        print("Connecting to simulation daemon...")
-        # Connect to already-running daemon, disable camera for sim
-        return ReachyMini(media_backend="no_media")
-    else:
-        print("Connecting to real robot...")
-        return ReachyMini()
+from shared.robot import get_robot, head_pose
 
 
 def wave_sequence(robot):
     """Perform a friendly wave sequence."""
     # Look up and to the side
     robot.goto_target(
-        head=create_head_pose(z=15, roll=10, degrees=True, mm=True),
+        head=head_pose(z=15, roll=10),
         duration=0.5
     )
     time.sleep(0.3)
@@ -36,19 +26,19 @@ def wave_sequence(robot):
     # Wiggle antennas (happy expression)
     for _ in range(3):
         robot.goto_target(
-            head=create_head_pose(z=15, roll=-10, degrees=True, mm=True),
+            head=head_pose(z=15, roll=-10),
             duration=0.2
         )
         time.sleep(0.2)
         robot.goto_target(
-            head=create_head_pose(z=15, roll=10, degrees=True, mm=True),
+            head=head_pose(z=15, roll=10),
             duration=0.2
         )
         time.sleep(0.2)
 
     # Return to neutral
     robot.goto_target(
-        head=create_head_pose(z=0, roll=0, degrees=True, mm=True),
+        head=head_pose(z=0, roll=0),
         duration=0.5
     )
 
@@ -1,6 +1,6 @@
 #!/bin/bash
 # Reachy-Mini Program Launcher
-# Usage: ./run.sh <program-name> [--sim]
+# Usage: ./run.sh <program-name> [--sim] [-- program-args...]
 
 set -e
 
@@ -17,17 +17,19 @@ NC='\033[0m' # No Color
 show_help() {
     echo -e "${BLUE}Reachy-Mini Program Launcher${NC}"
     echo ""
-    echo "Usage: ./run.sh <program-name> [options]"
+    echo "Usage: ./run.sh <program-name> [options] [-- program-args...]"
     echo ""
     echo "Options:"
     echo "  --sim       Run in simulation mode (MuJoCo)"
     echo "  --list      List available programs"
     echo "  --help      Show this help message"
+    echo "  --          Pass the remaining arguments to the program"
     echo ""
     echo "Examples:"
     echo "  ./run.sh wave-hello          # Run on real robot"
     echo "  ./run.sh wave-hello --sim    # Run in simulator"
     echo "  ./run.sh --list              # List all programs"
+    echo "  ./run.sh fuck-you -- --compile show.npz"
 }
 
 list_programs() {
@@ -124,12 +126,13 @@ run_program() {
     echo "----------------------------------------"
 
     # Run the program
-    python "$main_file"
+    python "$main_file" "${PROGRAM_ARGS[@]}"
 }
 
 # Parse arguments
 PROGRAM=""
 SIM_MODE="false"
+PROGRAM_ARGS=()
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -141,6 +144,11 @@ while [[ $# -gt 0 ]]; do
             list_programs
             exit 0
             ;;
+        --)
+            shift
+            PROGRAM_ARGS=("$@")
+            break
+            ;;
         --help|-h)
             show_help
             exit 0
@@ -1,5 +1,33 @@
 """
 Shared utilities for Reachy-Mini programs.
+
+Names are resolved on first access, so `import shared` stays cheap and heavy
+dependencies (numpy, torch, the robot SDK) load only when actually used.
 """
 
-from .tts import say, say_async
+import importlib
+
+_EXPORTS = {
+    "say": "tts",
+    "say_async": "tts",
+    "synthesize": "tts",
+    "models": "tts",
+    "get_robot": "robot",
+    "head_pose": "robot",
+    "move": "robot",
+    "pause": "robot",
+    "speak": "bundle",
+    "CycleWatchdog": "loop",
+    "Mixer": "mixer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
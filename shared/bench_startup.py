@@ -0,0 +1,170 @@
+"""
+Startup Benchmark
+=================
+Measures cold-start import time of every program, each in a fresh
+interpreter, and which heavy dependencies the import pulls in.
+
+Usage:
+    python -m shared.bench_startup                 # current tree
+    python -m shared.bench_startup --ref baseline  # compare with a git revision
+
+If the Reachy-Mini SDK is not installed, a minimal stand-in package is put on
+the probe's path so every revision imports all the way through. The SDK's own
+import cost is then not measured. Programs that still fail to import are
+reported but left out of the before/after comparison.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ["numpy", "cv2", "torch", "transformers", "reachy_mini"]
+
+# Runs in a fresh interpreter: import the program without calling main()
+_PROBE = """
+import importlib.util, json, sys, time
+heavy = {heavy!r}
+start = time.perf_counter()
+error = None
+try:
+    spec = importlib.util.spec_from_file_location("program", {path!r})
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "error": error,
+    "heavy": [m for m in heavy if m in sys.modules],
+}}))
+"""
+
+# Stand-in for the parts of the SDK the programs import at module level
+_SDK_STUB = {
+    "reachy_mini/__init__.py": "class ReachyMini:\n    pass\n",
+    "reachy_mini/utils.py": "def create_head_pose(**kwargs):\n    return kwargs\n",
+}
+
+
+def find_programs(root):
+    """Program name -> main.py under root/programs."""
+    return {
+        p.parent.name: p
+        for p in sorted((root / "programs").glob("*/main.py"))
+    }
+
+
+def measure(main_file, runs, extra_path=None):
+    """Median import time of main_file over runs fresh interpreters."""
+    env = dict(os.environ)
+    if extra_path:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(extra_path), env.get("PYTHONPATH")]))
+
+    results = []
+    for _ in range(runs):
+        probe = _PROBE.format(heavy=HEAVY_MODULES, path=str(main_file))
+        out = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=main_file.parent, env=env, capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    return {
+        "seconds": statistics.median(r["seconds"] for r in results),
+        "error": results[-1]["error"],
+        "heavy": results[-1]["heavy"],
+    }
+
+
+def measure_tree(root, runs, extra_path=None):
+    return {
+        name: measure(path, runs, extra_path)
+        for name, path in find_programs(root).items()
+    }
+
+
+def export_ref(ref, dest):
+    """Extract programs/ and shared/ at a git revision into dest."""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "programs", "shared"],
+        cwd=REPO_DIR, capture_output=True, check=True
+    ).stdout
+    Path(dest).mkdir(parents=True, exist_ok=True)
+    tar_file = Path(dest) / "ref.tar"
+    tar_file.write_bytes(archive)
+    with tarfile.open(tar_file) as tar:
+        tar.extractall(dest)
+    return Path(dest)
+
+
+def write_sdk_stub(dest):
+    """Write the stand-in reachy_mini package under dest."""
+    for name, source in _SDK_STUB.items():
+        path = Path(dest) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    return Path(dest)
+
+
+def _format(result):
+    if result is None:
+        return "-"
+    if result["error"]:
+        return "failed: " + result["error"].splitlines()[0][:50]
+    return f"{result['seconds'] * 1000:8.1f} ms"
+
+
+def _ok(result):
+    return result is not None and not result["error"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Program cold-start benchmark")
+    parser.add_argument("--ref", help="git revision to compare against (before)")
+    parser.add_argument("--runs", type=int, default=5, help="runs per program (median)")
+    parser.add_argument("--stub-sdk", action="store_true",
+                        help="use the stand-in SDK even if reachy_mini is installed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stub = None
+        if args.stub_sdk or importlib.util.find_spec("reachy_mini") is None:
+            stub = write_sdk_stub(Path(tmp) / "stub")
+
+        after = measure_tree(REPO_DIR, args.runs, stub)
+        before = {}
+        if args.ref:
+            root = export_ref(args.ref, Path(tmp) / "ref")
+            before = measure_tree(root, args.runs, stub)
+
+    print(f"Cold-start import time (median of {args.runs} runs)")
+    if stub:
+        print("Reachy-Mini SDK stubbed: its own import cost is not included")
+    print("-" * 72)
+    for name in sorted(set(after) | set(before)):
+        if args.ref:
+            b, a = before.get(name), after.get(name)
+            print(f"{name:14} before {_format(b)}")
+            print(f"{'':14} after  {_format(a)}")
+            if _ok(b) and _ok(a):
+                print(f"{'':14} change {(a['seconds'] - b['seconds']) * 1000:+8.1f} ms")
+            else:
+                print(f"{'':14} (not compared: import failed)")
+        else:
+            print(f"{name:14} {_format(after.get(name))}")
+        if name in after and after[name]["heavy"]:
+            print(f"{'':14} loads: {', '.join(after[name]['heavy'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Show Bundles
+============
+Ahead-of-time rendering for deterministic programs:
+1. Record: run the program against a BundleRecorder instead of a robot
+2. Compile: synthesize all speech into one audio track, save it with the
+   timestamped head trajectory as a single .npz bundle
+3. Play: replay the bundle on the robot with no TTS or pose computation
+
+Programs route their sleeps and speech through robot.pause() and speak() so
+the same code can run live or be recorded.
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+from .tts import DEFAULT_LANGUAGE, say_async, synthesize
+
+USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+class BundleRecorder:
+    """
+    Stand-in for ReachyMini that records a program on a virtual clock.
+
+    Nothing is sent to the robot and no time passes: goto_target() stores
+    the pose, sleep() advances the clock, say() stores the text.
+    """
+
+    records = True  # checked by robot.pause()
+
+    def __init__(self):
+        self.clock = 0.0
+        self.motion = []  # (time, head_pose, duration)
+        self.speech = []  # (time, text, language)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def goto_target(self, head=None, duration=0.5, **kwargs):
+        self.motion.append((self.clock, head, duration))
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def say(self, text, language=DEFAULT_LANGUAGE):
+        self.speech.append((self.clock, text, language))
+
+    def compile(self, path):
+        """
+        Synthesize the recorded speech and write the bundle to path.
+
+        Returns:
+            The compiled Bundle
+        """
+        import numpy as np
+
+        print(f"[BUNDLE] Synthesizing {len(self.speech)} lines...")
+        clips = []
+        sample_rate = None
+        for t, text, language in self.speech:
+            samples, sr = synthesize(text, language)
+            if sample_rate is None:
+                sample_rate = sr
+            elif sr != sample_rate:
+                raise ValueError(f"Mixed sample rates in bundle: {sr} != {sample_rate}")
+            clips.append((int(round(t * sr)), np.asarray(samples, dtype=np.float32)))
+
+        sample_rate = sample_rate or 16000
+        motion_end = max((t + d for t, _, d in self.motion), default=0.0)
+        length = max(
+            [int(round(max(self.clock, motion_end) * sample_rate))]
+            + [start + len(clip) for start, clip in clips]
+        )
+
+        # Overlapping lines are summed, like overlapping say_async() calls
+        audio = np.zeros(length, dtype=np.float32)
+        for start, clip in clips:
+            audio[start:start + len(clip)] += clip
+        np.clip(audio, -1.0, 1.0, out=audio)
+
+        bundle = Bundle(
+            audio=audio,
+            sample_rate=sample_rate,
+            times=np.array([t for t, _, _ in self.motion], dtype=np.float64),
+            poses=np.array([np.asarray(p, dtype=np.float64) for _, p, _ in self.motion]),
+            durations=np.array([d for _, _, d in self.motion], dtype=np.float64),
+        )
+        bundle.save(path)
+        print(f"[BUNDLE] Wrote {path} ({bundle.length:.1f}s, "
+              f"{len(bundle.times)} moves)")
+        return bundle
+
+
+def speak(robot, text, language=DEFAULT_LANGUAGE):
+    """Speak without blocking, or store the line when recording."""
+    if isinstance(robot, BundleRecorder):
+        robot.say(text, language)
+    else:
+        say_async(text, robot, language)
+
+
+# =============================================================================
+# PLAYBACK
+# =============================================================================
+
+class Bundle:
+    """Precomputed audio track plus timestamped head trajectory."""
+
+    def __init__(self, audio, sample_rate, times, poses, durations):
+        self.audio = audio
+        self.sample_rate = int(sample_rate)
+        self.times = times
+        self.poses = poses
+        self.durations = durations
+        self._wav_file = None
+
+    @property
+    def length(self):
+        """Total length of the show in seconds."""
+        motion_end = float((self.times + self.durations).max()) if len(self.times) else 0.0
+        return max(len(self.audio) / self.sample_rate, motion_end)
+
+    def save(self, path):
+        import numpy as np
+        np.savez(
+            path,
+            audio=self.audio,
+            sample_rate=self.sample_rate,
+            times=self.times,
+            poses=self.poses,
+            durations=self.durations,
+        )
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+        with np.load(path) as data:
+            return cls(
+                audio=data["audio"],
+                sample_rate=int(data["sample_rate"]),
+                times=data["times"],
+                poses=data["poses"],
+                durations=data["durations"],
+            )
+
+    def wav_file(self):
+        """Write the audio track to a temp WAV once, reuse it afterwards."""
+        if self._wav_file is None:
+            import soundfile as sf
+            self._wav_file = tempfile.mktemp(suffix='.wav')
+            sf.write(self._wav_file, self.audio, samplerate=self.sample_rate)
+        return self._wav_file
+
+    def close(self):
+        if self._wav_file is not None:
+            os.remove(self._wav_file)
+            self._wav_file = None
+
+
+def _start_audio(bundle, robot):
+    """Start the audio track without blocking."""
+    wav_file = bundle.wav_file()
+    if not USE_SIM and robot is not None:
+        thread = threading.Thread(target=robot.media.play_sound, args=(wav_file,))
+        thread.daemon = True
+        thread.start()
+    else:
+        subprocess.Popen(["afplay", wav_file])
+
+
+def play_bundle(robot, bundle):
+    """
+    Replay a compiled bundle once.
+
+    Moves are issued against a single start time, so a late goto_target()
+    does not push back the rest of the show.
+    """
+    bundle.wav_file()  # write the WAV before the clock starts
+    print(f"[BUNDLE] Playing {bundle.length:.1f}s show")
+
+    start = time.perf_counter()
+    _start_audio(bundle, robot)
+
+    for t, pose, duration in zip(bundle.times, bundle.poses, bundle.durations):
+        delay = start + t - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        robot.goto_target(head=pose, duration=float(duration))
+
+    remaining = start + bundle.length - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
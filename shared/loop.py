@@ -0,0 +1,172 @@
+"""
+Cycle Watchdog
+==============
+Supervises infinite-loop programs:
+1. Times every cycle against a budget (seconds)
+2. Keeps rolling statistics over the last N cycles
+3. Tracks how far the loop has fallen behind, so programs can adapt
+   (pick shorter routines, skip speech cues) until they catch up
+
+The budget can be given up front or calibrated from the first few cycles.
+The backlog is capped at one budget, so a budget that is too tight degrades
+the loop instead of keeping it "behind" forever.
+"""
+
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class CycleWatchdog:
+    """
+    Track cycle durations of a loop against a time budget.
+
+    Usage:
+        watchdog = CycleWatchdog(budget=5.0)   # or budget=None to calibrate
+        while True:
+            routine = watchdog.pick(ROUTINES)
+            with watchdog.cycle(routine.__name__):
+                routine(robot)
+    """
+
+    def __init__(self, budget=None, window=20, name="LOOP", calibrate=3,
+                 margin=0.15, max_consecutive=5):
+        """
+        Args:
+            budget: Target duration of one cycle in seconds, or None to use
+                the mean of the first `calibrate` cycles plus `margin`
+            window: Number of recent cycles kept for rolling statistics
+            name: Tag used in console output
+            calibrate: Cycles measured before setting the budget (budget=None)
+            margin: Headroom added to the calibrated mean (0.15 = 15%)
+            max_consecutive: Overruns in a row before warning that the
+                budget is unrealistic
+        """
+        self.budget = budget
+        self.name = name
+        self.durations = deque(maxlen=window)
+        self.count = 0
+        self.overruns = 0
+        self.consecutive_overruns = 0
+        self.debt = 0.0
+        self._by_label = {}
+        self._window = window
+        self._calibrate = calibrate
+        self._margin = margin
+        self._max_consecutive = max_consecutive
+
+    @contextmanager
+    def cycle(self, label=None):
+        """Time the enclosed block as one cycle."""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.record(time.perf_counter() - start, label)
+
+    def record(self, duration, label=None):
+        """Record a finished cycle and update how far behind the loop is."""
+        self.count += 1
+        self.durations.append(duration)
+        if label is not None:
+            self._by_label.setdefault(label, deque(maxlen=self._window)).append(duration)
+
+        if self.budget is None:
+            if self.count >= self._calibrate:
+                mean = sum(self.durations) / len(self.durations)
+                self.budget = mean * (1.0 + self._margin)
+                print(f"[{self.name}] Calibrated budget: {self.budget:.2f}s "
+                      f"(mean of {self.count} cycles {mean:.2f}s)")
+            return duration
+
+        # Overruns accumulate, capped at one budget; shorter cycles pay it back
+        self.debt = min(self.budget, max(0.0, self.debt + duration - self.budget))
+        if duration > self.budget:
+            self.overruns += 1
+            self.consecutive_overruns += 1
+            print(f"[{self.name}] Cycle {self.count} took {duration:.2f}s "
+                  f"(budget {self.budget:.2f}s, behind by {self.debt:.2f}s)")
+            if self.consecutive_overruns == self._max_consecutive:
+                print(f"[{self.name}] {self.consecutive_overruns} overruns in a row, "
+                      f"budget {self.budget:.2f}s looks unrealistic")
+        else:
+            self.consecutive_overruns = 0
+        return duration
+
+    @property
+    def behind(self):
+        """True while earlier overruns have not been caught up."""
+        return self.debt > 0.0
+
+    @property
+    def allowance(self):
+        """Time available for the next cycle to get back on schedule."""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.debt)
+
+    def expected(self, label):
+        """Rolling mean duration of cycles recorded under label, or None."""
+        samples = self._by_label.get(label)
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def pick(self, routines, choice=None):
+        """
+        Pick a routine for the next cycle.
+
+        On schedule: any routine (random by default).
+        Behind: only routines expected to fit the remaining allowance,
+        or the shortest known routine if none fit.
+
+        Routines are identified by __name__, matching the label passed
+        to cycle(). Routines never timed yet count as fitting.
+        """
+        choice = choice or random.choice
+
+        if not self.behind:
+            return choice(routines)
+
+        allowance = self.allowance
+        fitting = [
+            r for r in routines
+            if (self.expected(r.__name__) or 0.0) <= allowance
+        ]
+        if fitting:
+            return choice(fitting)
+
+        return min(routines, key=lambda r: self.expected(r.__name__) or 0.0)
+
+    def stats(self):
+        """Rolling statistics over the recent window of cycles."""
+        if not self.durations:
+            return {
+                "count": self.count, "overruns": self.overruns, "debt": self.debt,
+                "last": None, "mean": None, "min": None, "max": None, "p95": None,
+            }
+
+        ordered = sorted(self.durations)
+        p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        return {
+            "count": self.count,
+            "overruns": self.overruns,
+            "debt": self.debt,
+            "last": self.durations[-1],
+            "mean": sum(ordered) / len(ordered),
+            "min": ordered[0],
+            "max": ordered[-1],
+            "p95": p95,
+        }
+
+    def report(self):
+        """Print a one-line summary of the rolling statistics."""
+        s = self.stats()
+        if s["last"] is None:
+            print(f"[{self.name}] No cycles recorded")
+            return
+        budget = f"{self.budget:.2f}s" if self.budget is not None else "not calibrated"
+        print(f"[{self.name}] {s['count']} cycles, {s['overruns']} over budget "
+              f"({budget}) | mean {s['mean']:.2f}s, "
+              f"min {s['min']:.2f}s, max {s['max']:.2f}s, p95 {s['p95']:.2f}s")
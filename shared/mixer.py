@@ -0,0 +1,293 @@
+"""
+Audio Mixer
+===========
+Sums several NumPy sources into one output stream:
+1. Sources are mono float arrays: voice, music loops, sound effects
+2. Output is rendered in fixed-size blocks, with per-source gain
+3. Music is ducked while a voice is playing
+4. Blocks go to a sink: robot speaker, local speakers, or a buffer
+
+Headless use (no audio device needed):
+    mixer = Mixer()
+    mixer.add(click_track(bpm=120, beats=8), kind="music", loop=True)
+    mixer.add(samples, kind="voice")
+    audio = mixer.render(seconds=4.0)
+"""
+
+import threading
+import time
+
+import numpy as np
+
+VOICE = "voice"
+MUSIC = "music"
+EFFECT = "effect"
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+def _resample(samples, from_rate, to_rate):
+    """Linear resampling, good enough for speech and effects."""
+    if from_rate == to_rate:
+        return samples
+    length = int(round(len(samples) * to_rate / from_rate))
+    positions = np.linspace(0, len(samples) - 1, num=length)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+class Source:
+    """One playing sound inside the mixer."""
+
+    def __init__(self, samples, gain=1.0, kind=EFFECT, loop=False):
+        self.samples = samples
+        self.gain = gain
+        self.kind = kind
+        self.loop = loop
+        self.position = 0
+
+    @property
+    def finished(self):
+        return not self.loop and self.position >= len(self.samples)
+
+    def read(self, n):
+        """Next n samples (zero-padded once a one-shot source ends)."""
+        out = np.zeros(n, dtype=np.float32)
+        filled = 0
+        while filled < n and len(self.samples):
+            if self.position >= len(self.samples):
+                if not self.loop:
+                    break
+                self.position = 0
+            chunk = self.samples[self.position:self.position + n - filled]
+            out[filled:filled + len(chunk)] = chunk
+            filled += len(chunk)
+            self.position += len(chunk)
+        return out
+
+
+def click_track(bpm=120, beats=4, sample_rate=16000, click_ms=30, freq=1000.0):
+    """Simple metronome beat, useful as a music loop under the lyrics."""
+    beat_len = int(round(sample_rate * 60.0 / bpm))
+    click_len = min(beat_len, int(sample_rate * click_ms / 1000))
+
+    t = np.arange(click_len) / sample_rate
+    click = np.sin(2 * np.pi * freq * t) * np.linspace(1.0, 0.0, click_len)
+
+    track = np.zeros(beat_len * beats, dtype=np.float32)
+    for i in range(beats):
+        accent = 1.0 if i % 4 == 0 else 0.6
+        track[i * beat_len:i * beat_len + click_len] = accent * click
+    return track
+
+
+# =============================================================================
+# MIXER
+# =============================================================================
+
+class Mixer:
+    """
+    Real-time mixer rendering fixed-size blocks.
+
+    Sources can be added from any thread while the mixer is running.
+    """
+
+    def __init__(self, sample_rate=16000, block_size=512, master_gain=1.0,
+                 duck_gain=0.3):
+        """
+        Args:
+            sample_rate: Output rate in Hz; sources are resampled to it
+            block_size: Samples per output block
+            master_gain: Gain applied to the final mix
+            duck_gain: Music gain while a voice is playing
+        """
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.master_gain = master_gain
+        self.duck_gain = duck_gain
+        self._sources = []
+        self._lock = threading.Lock()
+        self._duck = 1.0
+        self._thread = None
+        self._stop = threading.Event()
+
+    def add(self, samples, gain=1.0, kind=EFFECT, loop=False, sample_rate=None):
+        """
+        Start playing samples.
+
+        Args:
+            samples: Mono audio as a float NumPy array in [-1, 1]
+            gain: Source gain
+            kind: VOICE, MUSIC or EFFECT (music is ducked under voices)
+            loop: Repeat until removed
+            sample_rate: Rate of samples, if different from the mixer's
+
+        Returns:
+            The Source, for remove() or later gain changes
+        """
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if sample_rate is not None:
+            samples = _resample(samples, sample_rate, self.sample_rate)
+
+        source = Source(samples, gain=gain, kind=kind, loop=loop)
+        with self._lock:
+            self._sources.append(source)
+        return source
+
+    def remove(self, source):
+        """Stop a source immediately."""
+        with self._lock:
+            if source in self._sources:
+                self._sources.remove(source)
+
+    @property
+    def active(self):
+        """True while any source is still playing."""
+        with self._lock:
+            return bool(self._sources)
+
+    def render_block(self):
+        """Mix the next block of output."""
+        n = self.block_size
+        voice = np.zeros(n, dtype=np.float32)
+        music = np.zeros(n, dtype=np.float32)
+
+        with self._lock:
+            for source in self._sources:
+                target = music if source.kind == MUSIC else voice
+                target += source.gain * source.read(n)
+            ducking = any(s.kind == VOICE for s in self._sources)
+            self._sources = [s for s in self._sources if not s.finished]
+
+        # Ramp the duck level across the block to avoid clicks
+        target = self.duck_gain if ducking else 1.0
+        duck = np.linspace(self._duck, target, n, dtype=np.float32)
+        self._duck = target
+
+        block = (voice + duck * music) * self.master_gain
+        np.clip(block, -1.0, 1.0, out=block)
+        return block
+
+    def render(self, seconds):
+        """Render a fixed length of output to a buffer (headless)."""
+        blocks = int(np.ceil(seconds * self.sample_rate / self.block_size))
+        if blocks == 0:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate([self.render_block() for _ in range(blocks)])
+
+    # ----- streaming -----
+
+    def start(self, sink):
+        """
+        Stream blocks to sink from a background thread.
+
+        The sink is opened on the caller's thread, so a missing device or
+        driver raises here instead of silently killing the mixer thread.
+        """
+        if self._thread is not None:
+            return
+        sink.open(self.sample_rate, self.block_size)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(sink,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop streaming and wait for the thread to finish."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def _run(self, sink):
+        block_time = self.block_size / self.sample_rate
+        try:
+            next_time = time.perf_counter()
+            while not self._stop.is_set():
+                sink.write(self.render_block())
+
+                # Sinks that don't block on write are paced by the clock
+                if not sink.blocking:
+                    next_time += block_time
+                    delay = next_time - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_time = time.perf_counter()
+        finally:
+            sink.close()
+
+
+# =============================================================================
+# SINKS
+# =============================================================================
+
+class BufferSink:
+    """Collects blocks in memory (headless runs and tests)."""
+
+    blocking = False
+
+    def __init__(self):
+        self.blocks = []
+
+    def open(self, sample_rate, block_size):
+        self.sample_rate = sample_rate
+
+    def write(self, block):
+        self.blocks.append(block.copy())
+
+    def close(self):
+        pass
+
+    @property
+    def audio(self):
+        if not self.blocks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self.blocks)
+
+
+class RobotSink:
+    """Streams blocks to the robot speaker."""
+
+    blocking = False
+
+    def __init__(self, robot):
+        self.robot = robot
+
+    def open(self, sample_rate, block_size):
+        self.robot.media.start_playing()
+
+    def write(self, block):
+        self.robot.media.push_audio_sample(block)
+
+    def close(self):
+        self.robot.media.stop_playing()
+
+
+class LocalSink:
+    """Streams blocks to the local speakers (needs sounddevice)."""
+
+    blocking = True
+
+    def open(self, sample_rate, block_size):
+        import sounddevice as sd
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate, blocksize=block_size, channels=1, dtype='float32'
+        )
+        self._stream.start()
+
+    def write(self, block):
+        self._stream.write(block.reshape(-1, 1))
+
+    def close(self):
+        self._stream.stop()
+        self._stream.close()
@@ -0,0 +1,62 @@
+"""
+Robot Helpers
+=============
+Connection and movement helpers shared by all programs.
+
+The Reachy-Mini SDK is imported on first use, not at import time, so
+programs start fast and can be imported without a robot (e.g. to compile
+a show bundle).
+"""
+
+import os
+import time
+
+USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
+
+
+def pause(robot, seconds):
+    """
+    Sleep for real, or advance the virtual clock of a recording stand-in
+    (e.g. bundle.BundleRecorder, which sets `records = True`).
+    """
+    if getattr(robot, "records", False):
+        robot.sleep(seconds)
+    else:
+        time.sleep(seconds)
+
+
+def get_robot():
+    """
+    Connect to robot or simulator.
+
+    In simulation: disables camera to avoid errors
+    On real robot: full media access
+    """
+    from reachy_mini import ReachyMini
+
+    if USE_SIM:
+        print("[SIM] Connecting to simulator...")
+        return ReachyMini(media_backend="no_media")
+    else:
+        print("[ROBOT] Connecting to real robot...")
+        return ReachyMini()
+
+
+def head_pose(z=0, roll=0):
+    """Head pose from height (mm) and roll (degrees)."""
+    from reachy_mini.utils import create_head_pose
+    return create_head_pose(z=z, roll=roll, degrees=True, mm=True)
+
+
+def move(robot, z=0, roll=0, duration=0.2, settle=0.0):
+    """
+    Move head and wait for the move to finish.
+
+    Args:
+        z: Height in mm (positive = up)
+        roll: Tilt left/right in degrees (positive = right)
+        duration: Time to reach position in seconds
+        settle: Extra wait after the move
+    """
+    robot.goto_target(head=head_pose(z=z, roll=roll), duration=duration)
+    pause(robot, duration + settle)
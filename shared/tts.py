@@ -4,70 +4,167 @@ Text-to-Speech Helper
 Provides TTS with fallback options:
 1. Hugging Face MMS-TTS (best quality, if available)
 2. macOS 'say' command (fallback)
+
+synthesize() renders speech to samples without playing it.
+
+MMS-TTS voices are loaded per language through a memory-bounded registry
+(see tts_models.py). Configure with:
+    REACHY_TTS_MEMORY_MB   resident budget across all voices (default 512)
+    REACHY_TTS_IDLE_SECS   unload voices idle this long (default 300)
 """
 
+import importlib.util
 import os
 import subprocess
 import tempfile
 
+from .tts_models import TTSModelRegistry, normalize_language
+
 USE_SIM = os.environ.get("REACHY_MINI_SIM", "0") == "1"
 
+DEFAULT_LANGUAGE = "eng"
+
 # Track if HuggingFace TTS is available
 _hf_available = None
-_hf_model = None
-_hf_tokenizer = None
+_hf_unavailable_languages = set()
+
+models = TTSModelRegistry(
+    memory_budget_mb=float(os.environ.get("REACHY_TTS_MEMORY_MB", "512")),
+    idle_timeout=float(os.environ.get("REACHY_TTS_IDLE_SECS", "300")),
+)
 
 
 def _check_hf_available():
-    """Check if HuggingFace TTS can be loaded."""
+    """Check if HuggingFace TTS can be loaded (without importing it yet)."""
     global _hf_available
     if _hf_available is None:
-        try:
-            from transformers import VitsModel, AutoTokenizer
-            _hf_available = True
-        except ImportError:
-            _hf_available = False
+        _hf_available = all(
+            importlib.util.find_spec(name) is not None
+            for name in ("transformers", "torch", "soundfile")
+        )
     return _hf_available
 
 
-def _load_hf_model():
-    """Load HuggingFace TTS model."""
-    global _hf_model, _hf_tokenizer
+def _load_hf_model(language=DEFAULT_LANGUAGE):
+    """Load HuggingFace TTS model for a language, falling back to English."""
+    global _hf_available
+    language = normalize_language(language)
+    try:
+        if language not in _hf_unavailable_languages:
+            try:
+                return models.get(language)
+            except OSError as e:
+                print(f"[TTS] No model for '{language}' ({e}), using English")
+                _hf_unavailable_languages.add(language)
+
+        return models.get(DEFAULT_LANGUAGE)
+    except ImportError:
+        # Installed, but too old or broken (e.g. transformers without VitsModel)
+        _hf_available = False
+        raise
+
+
+def _synthesize_hf(text, language=DEFAULT_LANGUAGE):
+    """Generate speech samples using HuggingFace."""
+    import torch
+
+    model, tokenizer = _load_hf_model(language)
 
-    if _hf_model is None:
-        print("[TTS] Loading Hugging Face model...")
-        from transformers import VitsModel, AutoTokenizer
-        _hf_model = VitsModel.from_pretrained('facebook/mms-tts-eng')
-        _hf_tokenizer = AutoTokenizer.from_pretrained('facebook/mms-tts-eng')
-        print("[TTS] Model ready!")
+    inputs = tokenizer(text, return_tensors='pt')
+    with torch.no_grad():
+        output = model(**inputs).waveform
 
-    return _hf_model, _hf_tokenizer
+    return output.squeeze().numpy(), model.config.sampling_rate
 
 
-def _say_with_hf(text):
-    """Generate and play speech using HuggingFace."""
-    import torch
+def _synthesize_macos(text, voice="Samantha", sample_rate=16000):
+    """Generate speech samples using macOS built-in TTS."""
     import soundfile as sf
 
-    model, tokenizer = _load_hf_model()
+    tmp_file = tempfile.mktemp(suffix='.wav')
+    subprocess.run(
+        ["say", "-v", voice, "-o", tmp_file, f"--data-format=LEF32@{sample_rate}", text],
+        check=True
+    )
+    samples, sr = sf.read(tmp_file, dtype='float32')
+    os.remove(tmp_file)
+    return samples, sr
 
-    inputs = tokenizer(text, return_tensors='pt')
-    with torch.no_grad():
-        output = model(**inputs).waveform
+
+def synthesize(text, language=DEFAULT_LANGUAGE):
+    """
+    Render text to audio samples without playing it.
+
+    Args:
+        text: Text to speak
+        language: MMS language code, e.g. "eng" or "lat"
+
+    Returns:
+        (samples, sample_rate): mono float32 NumPy array and its rate in Hz
+    """
+    global _hf_available
+    language = normalize_language(language)
+    if _check_hf_available():
+        try:
+            return _synthesize_hf(text, language)
+        except ImportError as e:
+            print(f"[TTS] Hugging Face TTS unusable ({e}), using fallback")
+            _hf_available = False
+    return _synthesize_macos(text)
+
+
+def _say_with_hf(text, language=DEFAULT_LANGUAGE):
+    """Generate and play speech using HuggingFace."""
+    import soundfile as sf
+
+    samples, sample_rate = _synthesize_hf(text, language)
 
     # Save and play
     tmp_file = tempfile.mktemp(suffix='.wav')
-    sf.write(tmp_file, output.squeeze().numpy(), samplerate=model.config.sampling_rate)
+    sf.write(tmp_file, samples, samplerate=sample_rate)
     subprocess.run(['afplay', tmp_file], check=True)
     os.remove(tmp_file)
 
 
+def _say_with_hf_async(text, language=DEFAULT_LANGUAGE):
+    """Generate and play speech using HuggingFace in a background thread."""
+    import threading
+
+    def _speak():
+        try:
+            _say_with_hf(text, language)
+        except Exception as e:
+            print(f"[TTS] Error: {e}, using fallback")
+            subprocess.run(["say", text])
+
+    thread = threading.Thread(target=_speak)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
 def _say_with_macos(text, voice="Samantha"):
     """Use macOS built-in TTS."""
     subprocess.run(["say", "-v", voice, text])
 
 
-def say(text, robot=None, blocking=True):
+def _play_with_hf(text, robot=None, language=DEFAULT_LANGUAGE):
+    """Generate speech with HuggingFace, play on robot speaker or Mac speakers."""
+    if USE_SIM or robot is None:
+        _say_with_hf(text, language)
+        return
+
+    import soundfile as sf
+
+    samples, sample_rate = _synthesize_hf(text, language)
+
+    tmp_file = tempfile.mktemp(suffix='.wav')
+    sf.write(tmp_file, samples, samplerate=sample_rate)
+    robot.media.play_sound(tmp_file)
+    os.remove(tmp_file)
+
+
+def say(text, robot=None, blocking=True, language=DEFAULT_LANGUAGE):
     """
     Speak text using best available TTS.
 
@@ -75,7 +172,9 @@ def say(text, robot=None, blocking=True):
         text: Text to speak
         robot: ReachyMini instance (for real robot speaker)
         blocking: If True, wait for speech to finish
+        language: MMS language code, e.g. "eng" or "lat"
     """
+    language = normalize_language(language)
     print(f"[SAY] {text}")
 
     try:
@@ -83,21 +182,16 @@ def say(text, robot=None, blocking=True):
             # Real robot - use robot speaker
             # First generate audio file, then play on robot
             if _check_hf_available():
-                import torch
-                import soundfile as sf
-
-                model, tokenizer = _load_hf_model()
-                inputs = tokenizer(text, return_tensors='pt')
-                with torch.no_grad():
-                    output = model(**inputs).waveform
-
-                tmp_file = tempfile.mktemp(suffix='.wav')
-                sf.write(tmp_file, output.squeeze().numpy(), samplerate=model.config.sampling_rate)
-                robot.media.play_sound(tmp_file)
-                os.remove(tmp_file)
+                _play_with_hf(text, robot, language)
             else:
                 # Fallback - no TTS available for robot
                 print("[TTS] No TTS available for robot")
+        elif language != DEFAULT_LANGUAGE and _check_hf_available():
+            # Simulator, non-English - the Mac voice would read it as English
+            if blocking:
+                _say_with_hf(text, language)
+            else:
+                _say_with_hf_async(text, language)
         else:
             # Simulator - use Mac speakers
             if blocking:
@@ -110,11 +204,32 @@ def say(text, robot=None, blocking=True):
         subprocess.Popen(["say", text])
 
 
-def say_async(text, robot=None):
-    """Speak without blocking (runs in background thread)."""
+def say_async(text, robot=None, language=DEFAULT_LANGUAGE, mixer=None):
+    """
+    Speak without blocking (runs in background thread).
+
+    With a mixer (see mixer.py), the speech is synthesized and mixed in as a
+    voice source instead of opening the output device on its own.
+    """
     import threading
 
+    language = normalize_language(language)
+
     def _speak():
+        if mixer is not None:
+            try:
+                samples, sample_rate = synthesize(text, language)
+                mixer.add(samples, kind="voice", sample_rate=sample_rate)
+                return
+            except Exception as e:
+                print(f"[TTS] Error: {e}, using fallback")
+        if language != DEFAULT_LANGUAGE and _check_hf_available():
+            # Needs a per-language voice; the model registry is thread-safe
+            try:
+                _play_with_hf(text, robot, language)
+                return
+            except Exception as e:
+                print(f"[TTS] Error: {e}, using fallback")
         # Use macOS say for async (simpler, avoids threading issues with torch)
         subprocess.run(["say", text])
 
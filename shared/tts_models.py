@@ -0,0 +1,199 @@
+"""
+TTS Model Registry
+==================
+Loads Hugging Face MMS-TTS voices per language on demand:
+1. One model per language (facebook/mms-tts-<iso639-3>)
+2. Resident set kept under a memory budget, least recently used evicted first
+3. Models idle for too long are unloaded by a background timer
+4. Load time and resident memory reported per model
+"""
+
+import gc
+import threading
+import time
+from collections import OrderedDict
+
+# Short codes accepted for convenience; MMS repos use ISO 639-3
+LANGUAGE_ALIASES = {
+    "en": "eng",
+    "la": "lat",
+    "es": "spa",
+    "fr": "fra",
+    "de": "deu",
+    "it": "ita",
+    "pt": "por",
+}
+
+
+def normalize_language(language):
+    """ISO 639-3 code for a language, resolving short aliases ("la" -> "lat")."""
+    return LANGUAGE_ALIASES.get(language, language)
+
+
+def model_name(language):
+    """Hugging Face repo for a language code."""
+    return f"facebook/mms-tts-{normalize_language(language)}"
+
+
+def _model_bytes(model):
+    """Memory held by a model's parameters and buffers."""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+class _Entry:
+    def __init__(self, language, model, tokenizer, load_time):
+        self.language = language
+        self.model = model
+        self.tokenizer = tokenizer
+        self.load_time = load_time
+        self.bytes = _model_bytes(model)
+        self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class TTSModelRegistry:
+    """
+    Memory-bounded cache of MMS-TTS models, keyed by normalized language code.
+
+    Usage:
+        registry = TTSModelRegistry(memory_budget_mb=512)
+        model, tokenizer = registry.get("lat")
+    """
+
+    def __init__(self, memory_budget_mb=512, idle_timeout=300.0):
+        """
+        Args:
+            memory_budget_mb: Max resident memory across all models
+            idle_timeout: Unload models unused for this many seconds (None = never)
+        """
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.idle_timeout = idle_timeout
+        self._entries = OrderedDict()  # language -> _Entry, oldest first
+        self._lock = threading.RLock()
+        self._reaper = None
+
+    @property
+    def resident_bytes(self):
+        with self._lock:
+            return sum(e.bytes for e in self._entries.values())
+
+    def get(self, language):
+        """
+        Return (model, tokenizer) for language, loading it if needed.
+
+        Raises:
+            OSError: If no MMS-TTS model exists for the language
+        """
+        language = normalize_language(language)
+        with self._lock:
+            self._unload_idle()
+
+            entry = self._entries.get(language)
+            if entry is None:
+                entry = self._load(language)
+                self._entries[language] = entry
+                self._enforce_budget(keep=language)
+                self._start_reaper()
+            else:
+                self._entries.move_to_end(language)
+
+            entry.last_used = time.monotonic()
+            entry.uses += 1
+            return entry.model, entry.tokenizer
+
+    def unload(self, language):
+        """Drop a model from memory."""
+        with self._lock:
+            self._unload(language)
+
+    def unload_idle(self):
+        """Drop every model unused for longer than idle_timeout."""
+        with self._lock:
+            self._unload_idle()
+
+    def stats(self):
+        """Per-model load time and resident memory, least recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.values())
+        return [
+            {
+                "language": e.language,
+                "model": model_name(e.language),
+                "load_time": e.load_time,
+                "bytes": e.bytes,
+                "uses": e.uses,
+                "idle": now - e.last_used,
+            }
+            for e in entries
+        ]
+
+    def report(self):
+        """Print the resident models and total memory against the budget."""
+        mb = 1024 * 1024
+        stats = self.stats()
+        resident = sum(s["bytes"] for s in stats)
+        print(f"[TTS] {len(stats)} models resident, "
+              f"{resident / mb:.0f}/{self.memory_budget / mb:.0f} MB")
+        for s in stats:
+            print(f"[TTS]   {s['model']}: {s['bytes'] / mb:.0f} MB, "
+                  f"loaded in {s['load_time']:.1f}s, {s['uses']} uses, "
+                  f"idle {s['idle']:.0f}s")
+
+    # ----- internals (call with the lock held) -----
+
+    def _start_reaper(self):
+        """Unload idle models periodically, even if no other voice is requested."""
+        if self.idle_timeout is None or self._reaper is not None:
+            return
+
+        interval = max(1.0, min(self.idle_timeout / 2, 60.0))
+
+        def _reap():
+            while True:
+                time.sleep(interval)
+                self.unload_idle()
+
+        self._reaper = threading.Thread(target=_reap, name="tts-idle-reaper")
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _load(self, language):
+        from transformers import VitsModel, AutoTokenizer
+
+        name = model_name(language)
+        print(f"[TTS] Loading {name}...")
+        start = time.perf_counter()
+        model = VitsModel.from_pretrained(name)
+        tokenizer = AutoTokenizer.from_pretrained(name)
+        entry = _Entry(language, model, tokenizer, time.perf_counter() - start)
+        print(f"[TTS] {name} ready ({entry.load_time:.1f}s, "
+              f"{entry.bytes / (1024 * 1024):.0f} MB)")
+        return entry
+
+    def _unload(self, language):
+        entry = self._entries.pop(language, None)
+        if entry is None:
+            return
+        print(f"[TTS] Unloading {model_name(language)}")
+        del entry
+        gc.collect()
+
+    def _unload_idle(self):
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        for language, entry in list(self._entries.items()):
+            if now - entry.last_used > self.idle_timeout:
+                self._unload(language)
+
+    def _enforce_budget(self, keep):
+        for language in list(self._entries):
+            if self.resident_bytes <= self.memory_budget:
+                return
+            if language != keep:
+                self._unload(language)
+
+        if self.resident_bytes > self.memory_budget:
+            print(f"[TTS] Warning: {model_name(keep)} alone exceeds the memory budget")